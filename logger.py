@@ -1,22 +1,150 @@
-import datetime
+import atexit
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
+
+# log() only queues entries; a background thread drains up to BATCH_SIZE of them
+# at a time and hands each file its share of the batch in a single write call
+BATCH_SIZE = 64
+
+# os.open fds are already non-inheritable (PEP 446), O_CLOEXEC is only belt-and-braces
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+def _close_log_fd(fd: int):
+    """Close a log file fd, advising the kernel to drop its cached pages first.
+    Logs are append-only and rarely read back; pages already written back are
+    dropped, dirty ones are queued for writeback and dropped by the kernel later."""
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass  # only advice
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+# timestamps only have minute resolution, so the "[hh:mm AM] " prefix is built once per minute
+_ts_cache = (-1, b"")
+
+def _timestamp_prefix() -> bytes:
+    global _ts_cache
+    now = time.time()
+    minute = int(now) // 60
+    if minute != _ts_cache[0]:
+        _ts_cache = (minute, f"[{time.strftime('%I:%M %p', time.localtime(now))}] ".encode())
+    return _ts_cache[1]
+
+def _write_all(fd: int, data):
+    """os.write until everything is written, a short write would drop the tail"""
+    with memoryview(data) as view:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+# control messages for the writer thread, queued in place of a resource name
+_FLUSH = object()
+_CLOSE = object()
 
 # Logging functionality
 class Logger:
     """Handles logging to files"""
-    def __init__(self, log_dir="logs"):
+    def __init__(self, log_dir="logs", max_handles=64):
         self.log_dir = log_dir
         # make sure log directory exists
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._path_cache: Dict[str, str] = {}
+
+        # open log files, only touched by the writer thread - least recently used closed first
+        self._fds: "OrderedDict[str, int]" = OrderedDict()
+        self._max_handles = max_handles
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, name="logger-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def get_log_path(self, resource_name: str) -> str:
-        return os.path.join(self.log_dir, f"{resource_name}.log")
+        path = self._path_cache.get(resource_name)
+        if path is None:
+            path = self._path_cache[resource_name] = os.path.join(self.log_dir, f"{resource_name}.log")
+        return path
+
+    def _get_fd(self, resource_name: str) -> int:
+        fd = self._fds.get(resource_name)
+        if fd is None:
+            fd = os.open(self.get_log_path(resource_name), _OPEN_FLAGS, 0o644)
+            self._fds[resource_name] = fd
+            if len(self._fds) > self._max_handles:
+                _, oldest = self._fds.popitem(last=False)
+                _close_log_fd(oldest)
+        else:
+            self._fds.move_to_end(resource_name)
+        return fd
+
+    def log(self, resource_name: str, message: Union[str, bytes]):
+        """Queue a log entry for the writer thread"""
+        if isinstance(message, str):
+            message = message.encode()
+        self._queue.put((resource_name, _timestamp_prefix(), message))
+
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending: Dict[str, List[Tuple[str, bytes, bytes]]] = {}
+            for item in batch:
+                key = item[0]
+                if key is _FLUSH or key is _CLOSE:
+                    # everything queued before the request has to be on disk first
+                    try:
+                        self._write(pending)
+                        pending = {}
+                        if key is _CLOSE:
+                            self._close_fds()
+                    finally:
+                        item[1].set()
+                else:
+                    pending.setdefault(key, []).append(item)
+            self._write(pending)
+
+    def _write(self, pending: Dict[str, List[Tuple[str, bytes, bytes]]]):
+        for resource_name, entries in pending.items():
+            # queued entries are separate prefix/message pieces, joined once per file
+            parts = []
+            for _, prefix, message in entries:
+                parts += (prefix, message, b"\n")
+            try:
+                _write_all(self._get_fd(resource_name), b"".join(parts))
+            except Exception as e:
+                # a bad entry must not take the writer thread down with it
+                print(f"Could not write log for '{resource_name}': {e}")
+
+    def _close_fds(self):
+        while self._fds:
+            _, fd = self._fds.popitem()
+            _close_log_fd(fd)
+
+    def _request(self, command: object):
+        done = threading.Event()
+        self._queue.put((command, done, None))
+        # never block on a writer thread that has died
+        while not done.wait(0.1):
+            if not self._writer.is_alive():
+                return
 
-    def log(self, resource_name: str, message: str):
-        """Write a log entry"""
-        timestamp = datetime.datetime.now().strftime("%I:%M %p")
-        log_entry = f"[{timestamp}] {message}"
+    def flush(self):
+        """Wait until every queued entry has been written"""
+        self._request(_FLUSH)
 
-        with open(self.get_log_path(resource_name), "a") as f:
-            f.write(log_entry + "\n")
\ No newline at end of file
+    def close(self):
+        """Write out queued entries and close all cached log files"""
+        self._request(_CLOSE)
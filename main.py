@@ -1,20 +1,59 @@
 import datetime
 import os
+import sys
 from typing import Dict
 from resources import Resource, ResourceRegistry
 from logger import Logger
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
 # Main application
 class CloudConnect:
     """Main app - handles CLI and resource management"""
+    MENU_TEXT = (
+        "\n1. Create Resource\n"
+        "2. Start Resource\n"
+        "3. Stop Resource\n"
+        "4. Delete Resource\n"
+        "5. View Logs\n"
+        "6. Exit\n"
+        "Enter choice: "
+    )
+    LOG_TAIL_BYTES = 64 * 1024
+
+    # config fields are read from the registered constructor signatures;
+    # the parser comes from the parameter annotation, the prompt from this table
+    _PARSERS = {int: int, bool: _parse_bool, str: str}
+    # short, often repeated values are interned - never free-form ones like access keys
+    _INTERNED = {"runtime", "region", "eviction_policy"}
+    _PROMPTS = {
+        "runtime": "Select runtime (python / nodejs / dotnet): ",
+        "region": "Select region (EastUS / WestEurope / CentralIndia): ",
+        "replica_count": "Select replica count (1 / 2 / 3): ",
+        "encryption_enabled": "Enable encryption? (true / false): ",
+        "access_key": "Enter access key: ",
+        "max_size_gb": "Enter max size (GB): ",
+        "ttl_seconds": "Enter TTL (seconds): ",
+        "capacity_mb": "Enter capacity (MB): ",
+        "eviction_policy": "Enter eviction policy (LRU / FIFO): ",
+    }
+
     def __init__(self):
         self.resources: Dict[str, Resource] = {}
         self.logger = Logger()
+        # menu choices '1'..'6' index straight into this tuple, None means exit
+        self._actions = (
+            self.create_resource, self.start_resource,
+            self.stop_resource, self.delete_resource,
+            self.view_logs, None
+        )
 
     def _get_resource(self, name: str) -> Resource:
-        if name not in self.resources:
+        resource = self.resources.get(name)
+        if resource is None:
             raise KeyError(f"Resource '{name}' not found.")
-        return self.resources[name]
+        return resource
 
     def create_resource(self):
         registered_types = ResourceRegistry.get_registered_types()
@@ -32,26 +71,27 @@ class CloudConnect:
                 print("Error: A resource with this name already exists.")
                 return
 
-            config = {'name': name}
-            if selected_type == "AppService":
-                config['runtime'] = input("Select runtime (python / nodejs / dotnet): ")
-                config['region'] = input("Select region (EastUS / WestEurope / CentralIndia): ")
-                config['replica_count'] = int(input("Select replica count (1 / 2 / 3): "))
-            elif selected_type == "StorageAccount":
-                config['encryption_enabled'] = input("Enable encryption? (true / false): ").lower() == 'true'
-                config['access_key'] = input("Enter access key: ")
-                config['max_size_gb'] = int(input("Enter max size (GB): "))
-            elif selected_type == "CacheDB":
-                config['ttl_seconds'] = int(input("Enter TTL (seconds): "))
-                config['capacity_mb'] = int(input("Enter capacity (MB): "))
-                config['eviction_policy'] = input("Enter eviction policy (LRU / FIFO): ")
-
-            self.resources[name] = ResourceRegistry.create(selected_type, **config)
+            # first constructor parameter is the name, asked for above
+            args = [name]
+            for field, annotation in ResourceRegistry.get_params_by_id(choice_idx)[1:]:
+                parser = sys.intern if field in self._INTERNED else self._PARSERS[annotation]
+                args.append(self._ask(parser, self._PROMPTS.get(field, f"Enter {field}: ")))
+
+            self.resources[name] = ResourceRegistry.create_by_id(choice_idx, *args)
             print(f"{selected_type} created successfully!")
 
         except (ValueError, IndexError):
             print("Invalid selection. Please try again.")
 
+    @staticmethod
+    def _ask(parser, prompt: str):
+        """Prompt until the input parses, so a typo doesn't lose earlier fields"""
+        while True:
+            try:
+                return parser(input(prompt))
+            except ValueError:
+                print("Invalid value. Please try again.")
+
     def start_resource(self):
         name = input("Enter resource name: ")
         try:
@@ -59,7 +99,7 @@ class CloudConnect:
             resource.start()
 
             timestamp = datetime.datetime.now().strftime("%I:%M %p")
-            print(f"{type(resource).__name__} started at {timestamp} in {getattr(resource, 'region', 'N/A')}")
+            print(f"{resource.type_name} started at {timestamp} in {resource.get_location()}")
             print(f"(Log written to {self.logger.get_log_path(name)})")
 
             self.logger.log(name, resource.get_start_log_message())
@@ -71,8 +111,8 @@ class CloudConnect:
         try:
             resource = self._get_resource(name)
             resource.stop()
-            print(f"{type(resource).__name__} stopped successfully.")
-            self.logger.log(name, f"{type(resource).__name__} stopped successfully")
+            print(f"{resource.type_name} stopped successfully.")
+            self.logger.log(name, f"{resource.type_name} stopped successfully")
         except (KeyError, ValueError, PermissionError) as e:
             print(f"{e}")
 
@@ -81,40 +121,51 @@ class CloudConnect:
         try:
             resource = self._get_resource(name)
             resource.soft_delete()
-            print(f"{type(resource).__name__} marked as deleted.")
-            self.logger.log(name, f"{type(resource).__name__} marked as deleted")
+            print(f"{resource.type_name} marked as deleted.")
+            self.logger.log(name, f"{resource.type_name} marked as deleted")
         except (KeyError, PermissionError) as e:
             print(f"{e}")
 
     def view_logs(self):
         name = input("Enter resource name: ")
+        self.logger.flush()
         log_file = self.logger.get_log_path(name)
-        if os.path.exists(log_file) and os.path.getsize(log_file) > 0:
-            print("Displaying latest log entries...")
-            with open(log_file, "r") as f:
-                print(f.read().strip())
-        else:
+        try:
+            size = os.stat(log_file).st_size
+        except (OSError, ValueError):
+            # missing file, or a name the filesystem can't hold (like os.path.exists)
+            size = 0
+        if size == 0:
             print("No logs found for this resource.")
+            return
+
+        print("Displaying latest log entries...")
+        with open(log_file, "rb") as f:
+            # only the tail of a large log is shown, starting at the first full line
+            if size > self.LOG_TAIL_BYTES:
+                # one extra byte tells whether the tail starts on a line boundary
+                f.seek(-(self.LOG_TAIL_BYTES + 1), os.SEEK_END)
+                at_line_start = f.read(1) == b"\n"
+                data = f.read()
+                if not at_line_start:
+                    # drop the partial first line, unless it is all there is
+                    cut = data.find(b"\n", 0, len(data) - 1)
+                    if cut != -1:
+                        data = data[cut + 1:]
+            else:
+                data = f.read()
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
 
     def run(self):
         while True:
-            print("\n1. Create Resource")
-            print("2. Start Resource")
-            print("3. Stop Resource")
-            print("4. Delete Resource")
-            print("5. View Logs")
-            print("6. Exit")
-
-            choice = input("Enter choice: ")
-            actions = {
-                '1': self.create_resource, '2': self.start_resource,
-                '3': self.stop_resource, '4': self.delete_resource,
-                '5': self.view_logs
-            }
-            if choice in actions:
-                actions[choice]()
-            elif choice == '6':
-                break
+            choice = input(self.MENU_TEXT)
+            if len(choice) == 1 and '1' <= choice <= '6':
+                action = self._actions[ord(choice) - ord('1')]
+                if action is None:
+                    break
+                action()
             else:
                 print("Invalid choice. Please try again.")
 
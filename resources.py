@@ -1,75 +1,159 @@
-import abc
-from typing import Dict, Type, List
+import inspect
+import typing
+from enum import IntEnum
+from typing import Type, List, Tuple
+
+# constructor parameter types a resource can be configured with from the CLI
+SUPPORTED_PARAM_TYPES = (str, int, bool)
+
+# Lifecycle states - compared by identity
+class State(IntEnum):
+    """Lifecycle state of a resource"""
+    STOPPED = 0
+    RUNNING = 1
 
 # Resource registry - keeps track of all resource types we support
 class ResourceRegistry:
     """Registry to manage different types of cloud resources"""
-    _registry: Dict[str, Type['Resource']] = {}
+    # the set of types is fixed at import time, so they live in lists indexed by type id
+    _registry: List[Tuple[str, Type['Resource']]] = []
+    # constructor parameters (name, annotation) of each type, read once at registration
+    _params: List[Tuple[Tuple[str, type], ...]] = []
 
     @classmethod
     def register(cls, resource_type_name: str):
         """Decorator to auto-register resource classes"""
         def decorator(resource_class: Type['Resource']) -> Type['Resource']:
-            cls._registry[resource_type_name] = resource_class
+            params = cls._read_params(resource_type_name, resource_class)
+            try:
+                # registering a name again replaces the old class, keeping its id
+                type_id = cls.get_type_id(resource_type_name)
+                cls._registry[type_id][1].RESOURCE_TYPE_ID = -1
+                cls._registry[type_id] = (resource_type_name, resource_class)
+                cls._params[type_id] = params
+            except ValueError:
+                type_id = len(cls._registry)
+                cls._registry.append((resource_type_name, resource_class))
+                cls._params.append(params)
+            resource_class.RESOURCE_TYPE_ID = type_id
             return resource_class
         return decorator
 
+    @staticmethod
+    def _read_params(resource_type_name: str, resource_class: Type['Resource']) -> Tuple[Tuple[str, type], ...]:
+        """Constructor parameters with resolved annotations - string annotations included"""
+        try:
+            hints = typing.get_type_hints(resource_class.__init__)
+        except Exception as e:
+            raise TypeError(f"Cannot resolve annotations of {resource_type_name}: {e}") from None
+        params = list(inspect.signature(resource_class.__init__).parameters.values())[1:]
+        for p in params:
+            if hints.get(p.name) not in SUPPORTED_PARAM_TYPES:
+                raise TypeError(
+                    f"{resource_type_name} parameter '{p.name}' must be annotated as one of "
+                    f"{', '.join(t.__name__ for t in SUPPORTED_PARAM_TYPES)}"
+                )
+        return tuple((p.name, hints[p.name]) for p in params)
+
+    @classmethod
+    def get_type_id(cls, resource_type_name: str) -> int:
+        for type_id, (name, _) in enumerate(cls._registry):
+            if name == resource_type_name:
+                return type_id
+        raise ValueError(f"Unknown resource type: '{resource_type_name}'")
+
     @classmethod
-    def create(cls, resource_type_name: str, **kwargs) -> 'Resource':
+    def _check_type_id(cls, type_id: int):
+        # -1 (unregistered) would otherwise index the last registered type
+        if not 0 <= type_id < len(cls._registry):
+            raise ValueError(f"Unknown resource type id: {type_id}")
+
+    @classmethod
+    def create(cls, resource_type_name: str, *args, **kwargs) -> 'Resource':
         """Create a new resource instance"""
-        if resource_type_name not in cls._registry:
-            raise ValueError(f"Unknown resource type: '{resource_type_name}'")
-        return cls._registry[resource_type_name](**kwargs)
+        return cls.create_by_id(cls.get_type_id(resource_type_name), *args, **kwargs)
+
+    @classmethod
+    def create_by_id(cls, type_id: int, *args, **kwargs) -> 'Resource':
+        """Create a new resource instance from its type id"""
+        cls._check_type_id(type_id)
+        resource_type_name, resource_class = cls._registry[type_id]
+        if kwargs:
+            # map keyword arguments onto the cached parameter order and call positionally
+            params = cls._params[type_id][len(args):]
+            if len(kwargs) != len(params):
+                raise TypeError(f"{resource_type_name} expects arguments: {', '.join(p for p, _ in params)}")
+            try:
+                args += tuple(kwargs[p] for p, _ in params)
+            except KeyError as e:
+                raise TypeError(f"{resource_type_name} missing argument {e}") from None
+        return resource_class(*args)
 
     @classmethod
     def get_registered_types(cls) -> List[str]:
-        return list(cls._registry.keys())
+        return [name for name, _ in cls._registry]
+
+    @classmethod
+    def get_params_by_id(cls, type_id: int) -> Tuple[Tuple[str, type], ...]:
+        """Constructor parameters of a resource type as (name, annotation) pairs"""
+        cls._check_type_id(type_id)
+        return cls._params[type_id]
 
 # Base class for all resources
-class Resource(abc.ABC):
+class Resource:
     """
     Base resource class - all cloud resources inherit from this
     """
+    __slots__ = ('name', 'type_name', 'state', 'is_deleted')
+    # set by ResourceRegistry.register
+    RESOURCE_TYPE_ID = -1
+
     def __init__(self, name: str):
         self.name = name
-        self.state = "stopped"
+        self.type_name = type(self).__name__
+        self.state = State.STOPPED
         self.is_deleted = False
 
-    @abc.abstractmethod
     def get_details(self) -> str:
         """Get resource configuration details"""
-        pass
+        raise NotImplementedError
 
     def start(self):
         """Start the resource"""
         if self.is_deleted:
             raise PermissionError(f"Resource '{self.name}' is deleted and cannot be started.")
-        if self.state == "running":
+        if self.state is State.RUNNING:
             raise ValueError(f"Resource '{self.name}' is already running.")
-        self.state = "running"
+        self.state = State.RUNNING
 
     def stop(self):
         """Stop the resource"""
         if self.is_deleted:
             raise PermissionError(f"Resource '{self.name}' is deleted and cannot be stopped.")
-        if self.state == "stopped":
+        if self.state is State.STOPPED:
             raise ValueError(f"Resource '{self.name}' is already stopped.")
-        self.state = "stopped"
+        self.state = State.STOPPED
 
     def soft_delete(self):
         """Mark resource as deleted (soft delete)"""
-        if self.state == "running":
+        if self.state is State.RUNNING:
             raise PermissionError("Cannot delete: Resource must be stopped first.")
         self.is_deleted = True
 
-    def get_start_log_message(self) -> str:
-        """Generate log message for start action"""
-        return f"{type(self).__name__} started"
+    def get_location(self) -> str:
+        """Region the resource runs in"""
+        return "N/A"
+
+    def get_start_log_message(self) -> bytes:
+        """Generate log message for start action, as bytes for the logger"""
+        return f"{self.type_name} started".encode()
 
 # Concrete resource types
 @ResourceRegistry.register("AppService")
 class AppService(Resource):
     """Application service resource"""
+    __slots__ = ('runtime', 'region', 'replica_count')
+
     def __init__(self, name: str, runtime: str, region: str, replica_count: int):
         super().__init__(name)
         self.runtime = runtime
@@ -79,12 +163,17 @@ class AppService(Resource):
     def get_details(self) -> str:
         return f"AppService: runtime={self.runtime}, region={self.region}, replicas={self.replica_count}"
 
-    def get_start_log_message(self) -> str:
-        return f"AppService started in {self.region}"
+    def get_location(self) -> str:
+        return self.region
+
+    def get_start_log_message(self) -> bytes:
+        return f"AppService started in {self.region}".encode()
 
 @ResourceRegistry.register("StorageAccount")
 class StorageAccount(Resource):
     """Storage account resource"""
+    __slots__ = ('encryption_enabled', 'access_key', 'max_size_gb')
+
     def __init__(self, name: str, encryption_enabled: bool, access_key: str, max_size_gb: int):
         super().__init__(name)
         self.encryption_enabled = encryption_enabled
@@ -97,6 +186,8 @@ class StorageAccount(Resource):
 @ResourceRegistry.register("CacheDB")
 class CacheDB(Resource):
     """Cache database resource"""
+    __slots__ = ('ttl_seconds', 'capacity_mb', 'eviction_policy')
+
     def __init__(self, name: str, ttl_seconds: int, capacity_mb: int, eviction_policy: str):
         super().__init__(name)
         self.ttl_seconds = ttl_seconds